@@ -1,16 +1,297 @@
 import sys
 import os
+import collections
+import concurrent.futures
+import multiprocessing
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QFileDialog, QListWidget, QScrollArea,
-    QTextEdit, QTableWidget, QTableWidgetItem, QAbstractItemView,
-    QHeaderView
+    QTextEdit, QTableView, QAbstractItemView,
+    QHeaderView, QStyledItemDelegate, QStyleOptionButton, QStyle
+)
+from PyQt6.QtCore import (
+    Qt, QPoint, QRect, QUrl, QObject, QThread, QEvent,
+    QAbstractTableModel, QModelIndex, pyqtSignal, pyqtSlot
+)
+from PyQt6.QtGui import (
+    QImage, QPixmap, QPainter, QPainterPath, QPen, QMouseEvent,
+    QDragEnterEvent, QDropEvent
 )
-from PyQt6.QtCore import Qt, QPoint, QUrl
-from PyQt6.QtGui import QImage, QPixmap, QPainter, QPen, QMouseEvent, QDragEnterEvent, QDropEvent
 import fitz  # PyMuPDF
+import numpy as np
 import pandas as pd
 
+try:
+    import xlsxwriter  # optional: streams export rows at constant memory
+except ImportError:
+    xlsxwriter = None
+
+# Structure-of-arrays layout for selections: one record per selection.
+# A structured array is ~5x smaller than a list of dicts of Python ints
+# and lets page filtering happen as a single vectorized comparison.
+SELECTION_DTYPE = np.dtype([
+    ('page', 'i4'),
+    ('x1', 'i4'), ('y1', 'i4'),
+    ('x2', 'i4'), ('y2', 'i4'),
+])
+
+
+def _empty_selections():
+    return np.empty(0, dtype=SELECTION_DTYPE)
+
+
+def _selections_to_dicts(sel_array):
+    """
+    Convert a selection array back to the list-of-dicts shape used at the
+    extraction boundary (preview and export workers).
+    """
+    return [
+        {
+            'page': int(s['page']),
+            'coords': (int(s['x1']), int(s['y1']), int(s['x2']), int(s['y2'])),
+        }
+        for s in sel_array
+    ]
+
+
+def _count_pages(pdf_path):
+    """
+    Page count of a PDF, or None if it cannot be opened. Top-level so it
+    can run on executor threads; MuPDF releases the GIL while parsing,
+    so counting many files overlaps their disk I/O and xref parsing.
+    """
+    try:
+        doc = fitz.open(pdf_path)
+    except Exception:
+        return None
+    count = len(doc)
+    doc.close()
+    return count
+
+
+def _extract_selection_texts(doc, sel_list, blocks_by_page=None):
+    """
+    Extract the text behind each selection, in selection order. Text
+    layout is the dominant extraction cost, so each page is laid out at
+    most once via get_text("blocks") and every selection on that page is
+    answered with a cheap bbox intersection against the cached blocks —
+    a selection over a blank margin or a pure image region touches no
+    block and costs nothing beyond the intersection test. Callers may
+    pass a persistent blocks_by_page dict to keep the layouts warm
+    across calls.
+    """
+    if blocks_by_page is None:
+        blocks_by_page = {}
+    texts = []
+    for sel in sel_list:
+        pg = sel['page']
+        if pg >= len(doc):
+            texts.append("")
+            continue
+
+        if pg not in blocks_by_page:
+            blocks_by_page[pg] = doc[pg].get_text("blocks")
+
+        x1, y1, x2, y2 = sel['coords']
+        rect = fitz.Rect(x1, y1, x2, y2)
+        parts = [
+            block[4].strip()
+            for block in blocks_by_page[pg]
+            if fitz.Rect(block[:4]).intersects(rect)
+        ]
+        texts.append("\n".join(p for p in parts if p))
+    return texts
+
+
+def _extract_texts(args):
+    """
+    Worker for export: open one PDF and extract the text behind each
+    selection. Top-level (not a method) so ProcessPoolExecutor can pickle
+    it; each worker process only touches fitz, never Qt. Returns
+    (pdf_path, [texts]) or (pdf_path, None) if the PDF cannot be opened.
+    """
+    pdf_path, sel_list = args
+    try:
+        doc = fitz.open(pdf_path)
+    except Exception:
+        return (pdf_path, None)
+
+    texts_for_pdf = _extract_selection_texts(doc, sel_list)
+    doc.close()
+    return (pdf_path, texts_for_pdf)
+
+
+class PageRenderer(QObject):
+    """
+    Render worker that lives on a dedicated QThread and owns its own
+    fitz.Document handles (MuPDF is not thread-safe, so the GUI thread's
+    handles never cross over). Render requests arrive as queued slot
+    calls and results leave as detached QImages, keeping the raster cost
+    off the GUI thread entirely. Serving current-page and prefetch
+    requests from the same queue also serializes all background MuPDF
+    work.
+    """
+
+    # (pdf_path, page_idx, rendered scale-1 image)
+    rendered = pyqtSignal(str, int, QImage)
+
+    # Same bound as the GUI-side handle cache: a long browsing session
+    # must not pin one file descriptor per PDF ever viewed
+    DOCS_MAXSIZE = 16
+
+    def __init__(self):
+        super().__init__()
+        # LRU of handles owned exclusively by the render thread
+        self._docs = collections.OrderedDict()
+
+    @pyqtSlot(str, int)
+    def render(self, pdf_path, page_idx):
+        # Failures still emit (with a null image): the main thread marked
+        # this key pending and would never retry the page otherwise
+        doc = self._docs.get(pdf_path)
+        if doc is None:
+            try:
+                doc = fitz.open(pdf_path)
+            except Exception:
+                self.rendered.emit(pdf_path, page_idx, QImage())
+                return
+            self._docs[pdf_path] = doc
+            if len(self._docs) > self.DOCS_MAXSIZE:
+                _, evicted = self._docs.popitem(last=False)
+                evicted.close()
+        else:
+            self._docs.move_to_end(pdf_path)
+
+        if page_idx >= len(doc):
+            self.rendered.emit(pdf_path, page_idx, QImage())
+            return
+
+        pix = doc[page_idx].get_pixmap(matrix=fitz.Identity)
+        samples = getattr(pix, "samples_mv", None) or pix.samples
+        # .copy() detaches the image from MuPDF's buffer before pix dies
+        qimg = QImage(samples, pix.width, pix.height,
+                      pix.stride, QImage.Format.Format_RGB888).copy()
+
+        self.rendered.emit(pdf_path, page_idx, qimg)
+
+    def close_docs(self):
+        for doc in self._docs.values():
+            doc.close()
+        self._docs.clear()
+
+
+class SelectionTableModel(QAbstractTableModel):
+    """
+    Read-only table model over the current PDF's selection array. The
+    view queries only the visible rows, and appending or removing a
+    selection is a single begin/end notification instead of a
+    QTableWidgetItem allocation per cell.
+    """
+
+    HEADERS = ("Page", "Coords", "Action")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._sels = _empty_selections()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._sels)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            sel = self._sels[index.row()]
+            if index.column() == 0:
+                return str(int(sel['page']) + 1)
+            if index.column() == 1:
+                return (f"({int(sel['x1'])},{int(sel['y1'])}) - "
+                        f"({int(sel['x2'])},{int(sel['y2'])})")
+        elif role == Qt.ItemDataRole.TextAlignmentRole and index.column() < 2:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal
+                and role == Qt.ItemDataRole.DisplayRole):
+            return self.HEADERS[section]
+        return None
+
+    # The selection arrays are replaced (np.concatenate / np.delete)
+    # rather than mutated, so each notifier swaps in the updated array.
+    def set_selections(self, sel_array):
+        self.beginResetModel()
+        self._sels = sel_array
+        self.endResetModel()
+
+    def append_selection(self, sel_array):
+        row = len(self._sels)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._sels = sel_array
+        self.endInsertRows()
+
+    def remove_selection(self, row, sel_array):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._sels = sel_array
+        self.endRemoveRows()
+
+
+class DeleteButtonDelegate(QStyledItemDelegate):
+    """
+    Paints the Action column as a push button and emits deleteRequested
+    on click. One delegate serves the whole column, so refreshing the
+    table no longer allocates a QPushButton and a closure per row.
+    """
+
+    deleteRequested = pyqtSignal(int)
+
+    def paint(self, painter, option, index):
+        btn = QStyleOptionButton()
+        btn.rect = option.rect.adjusted(4, 2, -4, -2)
+        btn.text = "Delete"
+        btn.state = QStyle.StateFlag.State_Enabled
+        QApplication.style().drawControl(
+            QStyle.ControlElement.CE_PushButton, btn, painter
+        )
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            self.deleteRequested.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class SelectionOverlay(QLabel):
+    """
+    Transparent label stacked over the page label that paints only the
+    in-progress (dashed blue) rubber-band rectangle. Keeping the rubber
+    band off the base pixmap means a mouse drag repaints just this thin
+    overlay instead of copying the whole page image on every move.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        # (x1, y1, x2, y2) in canonical scale-1 page coords, or None
+        # when no drag is in progress
+        self.temp_rect = None
+        self.zoom_factor = 1.0
+
+    def paintEvent(self, event):
+        if not self.temp_rect:
+            return
+        painter = QPainter(self)
+        painter.setPen(QPen(Qt.GlobalColor.blue, 2, Qt.PenStyle.DashLine))
+        z = self.zoom_factor
+        rx1, ry1, rx2, ry2 = (round(v * z) for v in self.temp_rect)
+        painter.drawRect(rx1, ry1, rx2 - rx1, ry2 - ry1)
+        painter.end()
+
+
 class PDFSelector(QMainWindow):
     """
     A PyQt6 PDF extraction tool with:
@@ -23,8 +304,21 @@ class PDFSelector(QMainWindow):
       - A smaller default window size + thinner middle panel.
     """
 
+    # Queued across threads to PageRenderer.render: (pdf_path, page_idx)
+    _render_requested = pyqtSignal(str, int)
+
     def __init__(self):
         super().__init__()
+
+        # Cap MuPDF's global object store so RSS stays bounded when
+        # browsing image-heavy corpora. store_maxsize is read-only in
+        # many PyMuPDF builds (fixed at compile time); the periodic
+        # store_shrink calls below are the portable half of the cap.
+        try:
+            fitz.TOOLS.store_maxsize = 256 * 1024 * 1024
+        except AttributeError:
+            pass
+
         # Reduced default size: narrower width
         self.setWindowTitle("PDF Extractor (Eason)")
         self.setGeometry(100, 100, 1000, 600)
@@ -44,7 +338,8 @@ class PDFSelector(QMainWindow):
         self.pdf_paths = {}
 
         # Selections across all PDFs:
-        #   pdf_selections[full_path] = [ { 'page': int, 'coords': (x1,y1,x2,y2) }, ... ]
+        #   pdf_selections[full_path] = structured array (SELECTION_DTYPE),
+        #   one record per selection: (page, x1, y1, x2, y2)
         self.pdf_selections = {}
 
         # For drawing new rectangles
@@ -55,6 +350,50 @@ class PDFSelector(QMainWindow):
         # Pixmap of the current page
         self.current_pixmap = None
 
+        # Display geometry cached for mouse-coordinate conversion:
+        # label offset of the pixmap and its display-space size
+        self._img_offset = (0, 0)
+        self._img_size = (0, 0)
+
+        # Committed selections for the current page, batched into one
+        # QPainterPath so a repaint is a single draw call instead of a
+        # drawRect per selection. None means "rebuild on next repaint";
+        # the complete flag is True when no rect was culled, i.e. the
+        # path already covers the whole page regardless of scrolling.
+        self._committed_path = None
+        self._committed_path_complete = True
+
+        # Cached page counts: {full_path -> number of pages}, filled the
+        # first time a PDF is opened so sync never re-parses just for len()
+        self._page_counts = {}
+
+        # LRU cache of open document handles: {full_path -> fitz.Document}.
+        # Re-opening a PDF re-parses its xref/catalog; keeping a bounded
+        # set of handles alive lets repeated operations skip that cost.
+        self._doc_cache = collections.OrderedDict()
+        self._doc_cache_maxsize = 16
+
+        # Per-PDF text-block cache for the preview:
+        #   {full_path -> {page_idx -> get_text("blocks") result}}
+        # so repeated previews reuse page layouts; dropped with the doc
+        self._blocks_cache = {}
+
+        # LRU cache of clean (no-overlay) scale-1 page pixmaps:
+        #   {(pdf_path, page_idx) -> QPixmap}
+        self._page_cache = collections.OrderedDict()
+        self._page_cache_maxsize = 8
+
+        # Dedicated render thread: current-page and prefetch requests go
+        # out over _render_requested (queued), QImages come back on the
+        # main thread and are folded into the pixmap cache
+        self._render_thread = QThread(self)
+        self._renderer = PageRenderer()
+        self._renderer.moveToThread(self._render_thread)
+        self._render_requested.connect(self._renderer.render)
+        self._renderer.rendered.connect(self._on_page_rendered)
+        self._render_thread.start()
+        self._render_pending = set()
+
         # ---------------------- UI Layout ----------------------
         main_widget = QWidget()
         self.setCentralWidget(main_widget)
@@ -105,14 +444,27 @@ class PDFSelector(QMainWindow):
         self.pdf_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.scroll_area.setWidget(self.pdf_label)
 
-        self.selections_table = QTableWidget()
-        self.selections_table.setColumnCount(3)
-        self.selections_table.setHorizontalHeaderLabels(["Page", "Coords", "Action"])
+        # Rubber-band overlay stacked on top of the page label
+        self.overlay_label = SelectionOverlay(self.pdf_label)
+
+        # Scrolling changes which selections are visible, so the culled
+        # committed path has to be rebuilt (see _committed_selections_path)
+        self.scroll_area.horizontalScrollBar().valueChanged.connect(self._on_scroll)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._on_scroll)
+
+        self.sel_model = SelectionTableModel()
+        self.selections_table = QTableView()
+        self.selections_table.setModel(self.sel_model)
         self.selections_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.selections_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.selections_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.selections_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
 
+        # Single delegate for the whole Action column (no per-row buttons)
+        self.delete_delegate = DeleteButtonDelegate(self.selections_table)
+        self.delete_delegate.deleteRequested.connect(self.delete_selection_at_row)
+        self.selections_table.setItemDelegateForColumn(2, self.delete_delegate)
+
         middle_layout.addWidget(self.scroll_area, stretch=4)
         middle_layout.addWidget(self.selections_table, stretch=2)
 
@@ -158,6 +510,20 @@ class PDFSelector(QMainWindow):
         else:
             event.ignore()
 
+    # --------------------------------------------------------------------------
+    # Shutdown
+    # --------------------------------------------------------------------------
+    def closeEvent(self, event):
+        self._render_thread.quit()
+        self._render_thread.wait()
+        self._renderer.close_docs()
+
+        for doc in self._doc_cache.values():
+            doc.close()
+        self._doc_cache.clear()
+        self._blocks_cache.clear()
+        super().closeEvent(event)
+
     # --------------------------------------------------------------------------
     # Folder Loading
     # --------------------------------------------------------------------------
@@ -181,14 +547,17 @@ class PDFSelector(QMainWindow):
         pdf_basename = item.text()
         full_path = self.pdf_paths[pdf_basename]
         self.current_pdf_path = full_path
-        self.current_pdf = fitz.open(self.current_pdf_path)
+        self.current_pdf = self._get_doc(self.current_pdf_path)
+        if self.current_pdf is None:
+            return
+        self._page_counts[self.current_pdf_path] = len(self.current_pdf)
         self.current_page_idx = 0
 
         # Restore or create an empty list for the new PDF
         if self.current_pdf_path in self.pdf_selections:
             self.set_current_selections(self.pdf_selections[self.current_pdf_path])
         else:
-            self.set_current_selections([])
+            self.set_current_selections(_empty_selections())
 
         self.display_page()
         self.update_extraction_preview()
@@ -196,21 +565,101 @@ class PDFSelector(QMainWindow):
     # --------------------------------------------------------------------------
     # Page Display & Navigation
     # --------------------------------------------------------------------------
+    def _get_base_pixmap(self, pdf_path, page_idx):
+        """
+        Return the clean (selection-free) scale-1 pixmap for a page from
+        the LRU cache, or None after queuing a render on the worker
+        thread. The GUI thread never rasterizes: misses come back via
+        _on_page_rendered, which redisplays once the pixmap is cached.
+        Zoom is applied afterwards with QPixmap.scaled, so changing zoom
+        never re-renders through MuPDF.
+        """
+        key = (pdf_path, page_idx)
+        if key in self._page_cache:
+            self._page_cache.move_to_end(key)
+            return self._page_cache[key]
+
+        if key not in self._render_pending:
+            self._render_pending.add(key)
+            self._render_requested.emit(pdf_path, page_idx)
+        return None
+
     def display_page(self):
         if not self.current_pdf:
             return
-        page = self.current_pdf[self.current_page_idx]
 
-        pix = page.get_pixmap(matrix=fitz.Matrix(self.zoom_factor, self.zoom_factor))
-        qimg = QImage(pix.samples, pix.width, pix.height,
-                      pix.stride, QImage.Format.Format_RGB888)
-        self.current_pixmap = QPixmap.fromImage(qimg)
+        base = self._get_base_pixmap(self.current_pdf_path, self.current_page_idx)
+        if base is None:
+            # Keep showing the previous content; the render thread will
+            # call back into display_page when this page is ready
+            return
+        self._committed_path = None
+
+        # Zoom is a Qt-side image scale of the canonical raster, not a
+        # MuPDF re-render; selections stay stored in scale-1 coords.
+        if self.zoom_factor != 1.0:
+            self.current_pixmap = base.scaled(
+                round(base.width() * self.zoom_factor),
+                round(base.height() * self.zoom_factor),
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+        else:
+            self.current_pixmap = base
 
         self.pdf_label.setPixmap(self.current_pixmap)
         self.pdf_label.resize(self.current_pixmap.size())
+        self.overlay_label.resize(self.current_pixmap.size())
+        self.overlay_label.zoom_factor = self.zoom_factor
+
+        # Cache geometry once per page display so every mouse move does
+        # plain int math instead of four Qt property round-trips
+        pix_w = self.current_pixmap.width()
+        pix_h = self.current_pixmap.height()
+        self._img_offset = (
+            max((self.pdf_label.width() - pix_w) // 2, 0),
+            max((self.pdf_label.height() - pix_h) // 2, 0),
+        )
+        self._img_size = (pix_w, pix_h)
 
         self.update_selection_display()
         self.refresh_selections_table()
+        self._prefetch_neighbors()
+
+        # Trim half of MuPDF's internal cache now that the page is shown;
+        # the pixmap LRU keeps what the UI actually needs
+        fitz.TOOLS.store_shrink(50)
+
+    def _prefetch_neighbors(self):
+        """
+        Queue background renders of the pages either side of the current
+        one so prev/next navigation lands on a warm pixmap cache.
+        """
+        for idx in (self.current_page_idx - 1, self.current_page_idx + 1):
+            if idx < 0 or idx >= len(self.current_pdf):
+                continue
+            key = (self.current_pdf_path, idx)
+            if key in self._page_cache or key in self._render_pending:
+                continue
+            self._render_pending.add(key)
+            self._render_requested.emit(self.current_pdf_path, idx)
+
+    def _on_page_rendered(self, pdf_path, page_idx, qimg):
+        key = (pdf_path, page_idx)
+        self._render_pending.discard(key)
+        if qimg.isNull():
+            # Render failed; with the pending key cleared, the next
+            # request for this page will retry
+            return
+        if key not in self._page_cache:
+            self._page_cache[key] = QPixmap.fromImage(qimg)
+            if len(self._page_cache) > self._page_cache_maxsize:
+                self._page_cache.popitem(last=False)
+
+        # If this render was for the page on screen, show it now
+        if (pdf_path == self.current_pdf_path
+                and page_idx == self.current_page_idx):
+            self.display_page()
 
     def prev_page(self):
         if self.current_pdf and self.current_page_idx > 0:
@@ -229,28 +678,93 @@ class PDFSelector(QMainWindow):
     # --------------------------------------------------------------------------
     def get_current_selections(self):
         if not hasattr(self, "_current_selections"):
-            self._current_selections = []
+            self._current_selections = _empty_selections()
         return self._current_selections
 
     def set_current_selections(self, selections):
         self._current_selections = selections
+        self._committed_path = None
 
     def clear_all_selections(self):
         self.pdf_selections.clear()
-        self.set_current_selections([])
+        self.set_current_selections(_empty_selections())
         self.update_selection_display()
         self.update_extraction_preview()
         self.refresh_selections_table()
 
+    def _get_doc(self, pdf_path):
+        """
+        Open document handle for a PDF, served from the LRU cache when
+        available. Cache hits skip the xref/catalog parse entirely.
+        Returns None if the PDF cannot be opened.
+        """
+        if pdf_path in self._doc_cache:
+            self._doc_cache.move_to_end(pdf_path)
+            return self._doc_cache[pdf_path]
+
+        try:
+            doc = fitz.open(pdf_path)
+        except Exception:
+            return None
+
+        self._doc_cache[pdf_path] = doc
+        if len(self._doc_cache) > self._doc_cache_maxsize:
+            # Evict the least-recently-used handle that is not on screen.
+            # The displayed document stays cache-resident, so it is still
+            # there for closeEvent (or a later eviction) to close instead
+            # of leaking as an orphan.
+            for cached_path in list(self._doc_cache):
+                if self._doc_cache[cached_path] is not self.current_pdf:
+                    evicted = self._doc_cache.pop(cached_path)
+                    self._blocks_cache.pop(cached_path, None)
+                    evicted.close()
+                    break
+        return doc
+
+    def _get_page_count(self, pdf_path):
+        """
+        Page count for a PDF, served from the cache when available.
+        Opening a document just to read len() parses the whole xref table,
+        so each path pays that cost at most once. Returns None if the PDF
+        cannot be opened.
+        """
+        if pdf_path in self._page_counts:
+            return self._page_counts[pdf_path]
+
+        doc = self._get_doc(pdf_path)
+        if doc is None:
+            return None
+
+        self._page_counts[pdf_path] = len(doc)
+        return self._page_counts[pdf_path]
+
     def sync_to_all_pdfs(self):
         if not self.current_pdf:
             return
 
         current_sels = self.get_current_selections()
-        if not current_sels:
+        if current_sels.size == 0:
             return
 
         self.pdf_selections[self.current_pdf_path] = current_sels
+
+        # Warm any cold page-count entries in parallel first, so the
+        # sync loop below is purely in-memory work
+        uncached = [
+            path for path in self.pdf_paths.values()
+            if path != self.current_pdf_path
+            and path not in self._page_counts
+            and os.path.isfile(path)
+        ]
+        if uncached:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(16, len(uncached))
+            ) as executor:
+                for path, count in zip(uncached,
+                                       executor.map(_count_pages, uncached)):
+                    if count is not None:
+                        self._page_counts[path] = count
+
         for pdf_basename, pdf_path in self.pdf_paths.items():
             if pdf_path == self.current_pdf_path:
                 continue
@@ -259,27 +773,24 @@ class PDFSelector(QMainWindow):
                 continue
 
             if pdf_path not in self.pdf_selections:
-                self.pdf_selections[pdf_path] = []
+                self.pdf_selections[pdf_path] = _empty_selections()
 
-            try:
-                other_doc = fitz.open(pdf_path)
-            except Exception:
+            max_pages = self._get_page_count(pdf_path)
+            if max_pages is None:
                 continue
 
-            max_pages = len(other_doc)
-            other_sels = self.pdf_selections[pdf_path]
+            # One vectorized bounds check instead of a per-selection loop
+            in_range = current_sels[current_sels['page'] < max_pages]
 
-            for sel in current_sels:
-                pg = sel['page']
-                if pg < max_pages:
-                    new_sel = {
-                        'page': pg,
-                        'coords': sel['coords']
-                    }
-                    other_sels.append(new_sel)
-
-            other_doc.close()
-            self.pdf_selections[pdf_path] = other_sels
+            # Skip records the target already has, so clicking Sync twice
+            # doesn't double every selection
+            existing = set(self.pdf_selections[pdf_path].tolist())
+            fresh = [rec for rec in in_range.tolist() if rec not in existing]
+            if fresh:
+                self.pdf_selections[pdf_path] = np.concatenate(
+                    [self.pdf_selections[pdf_path],
+                     np.array(fresh, dtype=SELECTION_DTYPE)]
+                )
 
         self.display_page()
         self.update_extraction_preview()
@@ -295,10 +806,12 @@ class PDFSelector(QMainWindow):
             self.selection_start = (x, y)
             self.selection_end = (x, y)
             self.temp_selection_rect = (x, y, x, y)
-            self.update_selection_display()
+            self.overlay_label.temp_rect = self.temp_selection_rect
+            self.overlay_label.update()
 
     def mouse_move_event(self, event: QMouseEvent):
         if event.buttons() & Qt.MouseButton.LeftButton and self.selection_start:
+            old_rect = self.temp_selection_rect
             x, y = self.get_image_coordinates(event.pos())
             x1, y1 = self.selection_start
             self.selection_end = (x, y)
@@ -306,76 +819,124 @@ class PDFSelector(QMainWindow):
                 min(x1, x), min(y1, y),
                 max(x1, x), max(y1, y)
             )
-            self.update_selection_display()
+            self.overlay_label.temp_rect = self.temp_selection_rect
+
+            # Repaint only the union of the old and new rubber-band boxes
+            # (padded for the 2px pen), not the whole page.
+            dirty = self._display_qrect(self.temp_selection_rect)
+            if old_rect:
+                dirty = dirty.united(self._display_qrect(old_rect))
+            self.overlay_label.update(dirty.adjusted(-2, -2, 2, 2))
 
     def mouse_release_event(self, event: QMouseEvent):
         if event.button() == Qt.MouseButton.LeftButton and self.selection_start:
             x1, y1 = self.selection_start
             x2, y2 = self.selection_end
-            new_sel = {
-                'page': self.current_page_idx,
-                'coords': (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
-            }
 
-            all_sels = self.get_current_selections()
-            all_sels.append(new_sel)
+            # A click without a drag leaves a zero-area rect; discard it
+            if x1 == x2 or y1 == y2:
+                self.selection_start = None
+                self.selection_end = None
+                self.temp_selection_rect = None
+                self.overlay_label.temp_rect = None
+                self.overlay_label.update()
+                return
+
+            new_sel = np.array(
+                [(self.current_page_idx,
+                  min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))],
+                dtype=SELECTION_DTYPE,
+            )
+
+            all_sels = np.concatenate([self.get_current_selections(), new_sel])
             self.set_current_selections(all_sels)
             self.pdf_selections[self.current_pdf_path] = all_sels
 
             self.selection_start = None
             self.selection_end = None
             self.temp_selection_rect = None
+            self.overlay_label.temp_rect = None
+            self.overlay_label.update()
 
             self.update_selection_display()
             self.update_extraction_preview()
-            self.refresh_selections_table()
+            self._append_selection_row(all_sels)
 
     # --------------------------------------------------------------------------
     # Table of Selections
     # --------------------------------------------------------------------------
+    def _append_selection_row(self, all_sels):
+        # O(1) append path for a freshly drawn selection; the model
+        # reset is reserved for PDF switches and bulk changes
+        self.sel_model.append_selection(all_sels)
+
+    def _remove_selection_row(self, row_idx, all_sels):
+        self.sel_model.remove_selection(row_idx, all_sels)
+
     def refresh_selections_table(self):
         if not self.current_pdf:
-            self.selections_table.clearContents()
-            self.selections_table.setRowCount(0)
+            self.sel_model.set_selections(_empty_selections())
             return
-
-        all_sels = self.get_current_selections()
-        self.selections_table.setRowCount(len(all_sels))
-
-        for row_idx, sel in enumerate(all_sels):
-            page_str = str(sel['page'] + 1)
-            (x1, y1, x2, y2) = sel['coords']
-            coords_str = f"({x1},{y1}) - ({x2},{y2})"
-
-            page_item = QTableWidgetItem(page_str)
-            page_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            coords_item = QTableWidgetItem(coords_str)
-            coords_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            self.selections_table.setItem(row_idx, 0, page_item)
-            self.selections_table.setItem(row_idx, 1, coords_item)
-
-            btn_delete = QPushButton("Delete")
-            btn_delete.clicked.connect(lambda _, r=row_idx: self.delete_selection_at_row(r))
-            self.selections_table.setCellWidget(row_idx, 2, btn_delete)
-
-        self.selections_table.resizeRowsToContents()
+        self.sel_model.set_selections(self.get_current_selections())
 
     def delete_selection_at_row(self, row_idx: int):
         all_sels = self.get_current_selections()
         if 0 <= row_idx < len(all_sels):
-            all_sels.pop(row_idx)
+            all_sels = np.delete(all_sels, row_idx)
             self.set_current_selections(all_sels)
             self.pdf_selections[self.current_pdf_path] = all_sels
 
             self.update_selection_display()
             self.update_extraction_preview()
-            self.refresh_selections_table()
+            self._remove_selection_row(row_idx, all_sels)
 
     # --------------------------------------------------------------------------
     # Rendering Selections
     # --------------------------------------------------------------------------
+    def _visible_display_rect(self):
+        """Scroll-viewport rect in display (label) coordinates."""
+        return QRect(
+            self.scroll_area.horizontalScrollBar().value(),
+            self.scroll_area.verticalScrollBar().value(),
+            self.scroll_area.viewport().width(),
+            self.scroll_area.viewport().height(),
+        )
+
+    def _on_scroll(self, _value):
+        # Only rebuild when the last path build actually culled rects;
+        # otherwise every selection is already in the path, nothing new
+        # can scroll into view, and the scroll stays a pure viewport blit
+        if self._committed_path is not None and self._committed_path_complete:
+            return
+        self._committed_path = None
+        self.update_selection_display()
+
+    def _committed_selections_path(self):
+        """
+        Path of the committed rects on the current page, in display
+        coords, culled to the scroll viewport so draw cost stays flat no
+        matter how many selections are off-screen. Rebuilt only after
+        selections, page, zoom, or scroll change; otherwise repaints
+        reuse the cached path in one draw call.
+        """
+        if self._committed_path is None:
+            path = QPainterPath()
+            all_sels = self.get_current_selections()
+            on_page = all_sels[all_sels['page'] == self.current_page_idx]
+            vis_rect = self._visible_display_rect()
+            z = self.zoom_factor
+            culled_any = False
+            for sel in on_page:
+                x1, y1 = round(int(sel['x1']) * z), round(int(sel['y1']) * z)
+                x2, y2 = round(int(sel['x2']) * z), round(int(sel['y2']) * z)
+                if QRect(x1, y1, x2 - x1, y2 - y1).intersects(vis_rect):
+                    path.addRect(x1, y1, x2 - x1, y2 - y1)
+                else:
+                    culled_any = True
+            self._committed_path = path
+            self._committed_path_complete = not culled_any
+        return self._committed_path
+
     def update_selection_display(self):
         if not self.current_pixmap:
             return
@@ -383,17 +944,7 @@ class PDFSelector(QMainWindow):
         pixmap = QPixmap(self.current_pixmap)
         painter = QPainter(pixmap)
         painter.setPen(QPen(Qt.GlobalColor.red, 2))
-
-        for sel in self.get_current_selections():
-            if sel['page'] == self.current_page_idx:
-                x1, y1, x2, y2 = sel['coords']
-                painter.drawRect(x1, y1, x2 - x1, y2 - y1)
-
-        if self.temp_selection_rect:
-            painter.setPen(QPen(Qt.GlobalColor.blue, 2, Qt.PenStyle.DashLine))
-            rx1, ry1, rx2, ry2 = self.temp_selection_rect
-            painter.drawRect(rx1, ry1, rx2 - rx1, ry2 - ry1)
-
+        painter.drawPath(self._committed_selections_path())
         painter.end()
         self.pdf_label.setPixmap(pixmap)
 
@@ -405,38 +956,34 @@ class PDFSelector(QMainWindow):
             self.extraction_preview.clear()
             return
 
+        sel_dicts = _selections_to_dicts(self.get_current_selections())
+        page_blocks = self._blocks_cache.setdefault(self.current_pdf_path, {})
+        texts = _extract_selection_texts(self.current_pdf, sel_dicts, page_blocks)
+
         text_preview = ""
-        for sel in self.get_current_selections():
-            pg = sel['page']
-            (x1, y1, x2, y2) = sel['coords']
-            rect = fitz.Rect(x1, y1, x2, y2)
-            text = self.current_pdf[pg].get_text("text", clip=rect).strip()
+        for sel, text in zip(sel_dicts, texts):
             if text:
-                text_preview += f"--- Page {pg + 1} ---\n{text}\n\n"
+                text_preview += f"--- Page {sel['page'] + 1} ---\n{text}\n\n"
 
         self.extraction_preview.setPlainText(text_preview.strip())
 
     # --------------------------------------------------------------------------
     # Coordinate Conversion
     # --------------------------------------------------------------------------
+    def _display_qrect(self, rect_tuple):
+        """Canonical scale-1 rect tuple -> QRect in display (zoomed) coords."""
+        x1, y1, x2, y2 = (round(v * self.zoom_factor) for v in rect_tuple)
+        return QRect(x1, y1, x2 - x1, y2 - y1)
+
     def get_image_coordinates(self, event_pos: QPoint):
         if not self.current_pixmap:
             return (0, 0)
 
-        lbl_w = self.pdf_label.width()
-        lbl_h = self.pdf_label.height()
-        pix_w = self.current_pixmap.width()
-        pix_h = self.current_pixmap.height()
-
-        offset_x = max((lbl_w - pix_w) // 2, 0)
-        offset_y = max((lbl_h - pix_h) // 2, 0)
-
-        x = event_pos.x() - offset_x
-        y = event_pos.y() - offset_y
+        x = max(0, min(event_pos.x() - self._img_offset[0], self._img_size[0]))
+        y = max(0, min(event_pos.y() - self._img_offset[1], self._img_size[1]))
 
-        x = max(0, min(x, pix_w))
-        y = max(0, min(y, pix_h))
-        return (x, y)
+        # Store canonical scale-1 page coords regardless of display zoom
+        return (round(x / self.zoom_factor), round(y / self.zoom_factor))
 
     # --------------------------------------------------------------------------
     # Export Selections in Columns
@@ -448,51 +995,69 @@ class PDFSelector(QMainWindow):
         if self.current_pdf_path:
             self.pdf_selections[self.current_pdf_path] = self.get_current_selections()
 
-        pdf_to_texts = {}
-        for pdf_path, sel_list in self.pdf_selections.items():
-            if not os.path.isfile(pdf_path):
-                continue
-            try:
-                doc = fitz.open(pdf_path)
-            except Exception:
-                continue
-
-            texts_for_pdf = []
-            for sel in sel_list:
-                pg = sel['page']
-                x1, y1, x2, y2 = sel['coords']
-                if pg < len(doc):
-                    rect = fitz.Rect(x1, y1, x2, y2)
-                    extracted = doc[pg].get_text("text", clip=rect).strip()
-                    texts_for_pdf.append(extracted)
-                else:
-                    texts_for_pdf.append("")
+        # Serialize the arrays back to list-of-dicts at the process
+        # boundary; workers never see NumPy types.
+        jobs = [
+            (pdf_path, _selections_to_dicts(sel_array))
+            for pdf_path, sel_array in self.pdf_selections.items()
+            if os.path.isfile(pdf_path)
+        ]
 
-            doc.close()
-            pdf_to_texts[pdf_path] = texts_for_pdf
+        # Extraction is CPU-bound MuPDF work; fan the PDFs out across
+        # one worker process per core and keep the DataFrame assembly here.
+        pdf_to_texts = {}
+        if jobs:
+            # Spawn, not fork: the render QThread mutates MuPDF's global
+            # store, and a forked child would inherit a snapshot of it in
+            # an arbitrary state before calling fitz.open itself. Spawn
+            # also makes the __main__ guard actually protect the workers.
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                for pdf_path, texts_for_pdf in executor.map(_extract_texts, jobs):
+                    if texts_for_pdf is None:
+                        continue
+                    pdf_to_texts[pdf_path] = texts_for_pdf
+            fitz.TOOLS.store_shrink(50)
 
         if not pdf_to_texts:
             return
 
+        file_name, _ = QFileDialog.getSaveFileName(
+            self, "Save Excel File", "", "Excel Files (*.xlsx)"
+        )
+        if not file_name:
+            return
+
         max_sel_count = max(len(lst) for lst in pdf_to_texts.values())
-        columns = ["PDF Name"] + [f"Selection {i+1}" for i in range(max_sel_count)]
+        header = ["PDF Name"] + [f"Selection {i+1}" for i in range(max_sel_count)]
+
+        if xlsxwriter is not None:
+            # constant_memory flushes each finished row to disk, so peak
+            # RAM stays flat no matter how many PDFs are exported
+            workbook = xlsxwriter.Workbook(file_name, {"constant_memory": True})
+            worksheet = workbook.add_worksheet()
+            worksheet.write_row(0, 0, header)
+            for row_idx, (pdf_path, texts) in enumerate(pdf_to_texts.items(), start=1):
+                padded = texts + [""] * (max_sel_count - len(texts))
+                worksheet.write_row(row_idx, 0, [os.path.basename(pdf_path)] + padded)
+            workbook.close()
+            return
 
-        data_rows = []
-        for pdf_path, texts in pdf_to_texts.items():
-            pdf_name = os.path.basename(pdf_path)
-            row = [pdf_name] + texts
-            # pad if needed
-            if len(texts) < max_sel_count:
-                row.extend([""] * (max_sel_count - len(texts)))
-            data_rows.append(row)
+        # Fallback without xlsxwriter: column-oriented build so pandas
+        # allocates each column's array once instead of row by row.
+        cols = {"PDF Name": []}
+        for i in range(max_sel_count):
+            cols[f"Selection {i+1}"] = []
 
-        df = pd.DataFrame(data_rows, columns=columns)
+        for pdf_path, texts in pdf_to_texts.items():
+            cols["PDF Name"].append(os.path.basename(pdf_path))
+            for i in range(max_sel_count):
+                cols[f"Selection {i+1}"].append(texts[i] if i < len(texts) else "")
 
-        file_name, _ = QFileDialog.getSaveFileName(
-            self, "Save Excel File", "", "Excel Files (*.xlsx)"
-        )
-        if file_name:
-            df.to_excel(file_name, index=False)
+        df = pd.DataFrame(cols)
+        df.to_excel(file_name, index=False)
 
 
 # ------------------------------------------------------------------------------